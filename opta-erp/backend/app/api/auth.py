@@ -1,12 +1,14 @@
 # app/api/auth.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from datetime import timedelta
 from typing import List
 
 from ..core.db import get_db
-from ..core.security import authenticate_user, create_access_token, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES, get_current_active_user, get_superadmin_user
+from ..core.security import authenticate_user, create_access_token, create_session, get_password_hash_async, ACCESS_TOKEN_EXPIRE_MINUTES, SESSION_COOKIE, get_current_active_user, get_superadmin_user, invalidate_user_cache
 from ..models.user import User, UserRole
 from ..schemas.user import UserCreate, User as UserSchema, Token, UserUpdate
 
@@ -16,8 +18,8 @@ router = APIRouter(
 )
 
 @router.post("/token", response_model=Token)
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = authenticate_user(db, form_data.username, form_data.password)
+async def login_for_access_token(response: Response, form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -28,15 +30,26 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     access_token = create_access_token(
         data={"sub": user.email, "role": user.role}, expires_delta=access_token_expires
     )
+    # Browser clients authenticate via this cookie, served from Redis;
+    # the bearer token keeps working for everything else
+    session_id = await create_session(user)
+    response.set_cookie(
+        SESSION_COOKIE,
+        session_id,
+        max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        httponly=True,
+        samesite="lax",
+    )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/register", response_model=UserSchema)
-async def register_user(user: UserCreate, db: Session = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
+    result = await db.execute(select(User).where(User.email == user.email))
+    db_user = result.scalar_one_or_none()
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    
-    hashed_password = get_password_hash(user.password)
+
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(
         email=user.email,
         hashed_password=hashed_password,
@@ -44,8 +57,8 @@ async def register_user(user: UserCreate, db: Session = Depends(get_db), current
         role=user.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 @router.get("/users/me", response_model=UserSchema)
@@ -53,26 +66,34 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
     return current_user
 
 @router.get("/users", response_model=List[UserSchema])
-async def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
-    users = db.query(User).offset(skip).limit(limit).all()
+async def read_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
+    result = await db.execute(select(User).options(raiseload("*")).offset(skip).limit(limit))
+    users = result.scalars().all()
     return users
 
 @router.put("/users/{user_id}", response_model=UserSchema)
-async def update_user(user_id: int, user_data: UserUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
-    db_user = db.query(User).filter(User.id == user_id).first()
+async def update_user(user_id: int, user_data: UserUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_superadmin_user)):
+    result = await db.execute(select(User).where(User.id == user_id))
+    db_user = result.scalar_one_or_none()
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
-    
+
+    old_email = db_user.email
+
     # Update fields that are provided
-    update_data = user_data.dict(exclude_unset=True)
-    
+    update_data = user_data.model_dump(exclude_unset=True)
+
     # If password is being updated, hash it
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
-    
+        update_data["hashed_password"] = await get_password_hash_async(update_data.pop("password"))
+
     for key, value in update_data.items():
         setattr(db_user, key, value)
-    
-    db.commit()
-    db.refresh(db_user)
+
+    await db.commit()
+    await db.refresh(db_user)
+
+    # Drop any cached copy so role/is_active changes take effect immediately
+    await invalidate_user_cache(old_email, db_user.email)
+
     return db_user
@@ -1,11 +1,14 @@
 # app/api/inventory.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+import orjson
 from ..core.db import get_db
+from ..core.cache import cache_get, cache_set, cache_delete, cache_delete_match
 from ..core.security import get_current_active_user
 from ..models.user import User
-from ..models.inventory import Category, Product, InventoryItem, StockStatus
+from ..models.inventory import Category, Product, InventoryItem, StockStatus, products_with_stock, refresh_products_with_stock
 from ..schemas.inventory import (
     Category as CategorySchema,
     CategoryCreate,
@@ -16,7 +19,9 @@ from ..schemas.inventory import (
     InventoryItem as InventoryItemSchema,
     InventoryItemCreate,
     InventoryItemUpdate,
-    ProductWithStock
+    ProductWithStock,
+    ProductListItem,
+    StockStatus as StockStatusSchema
 )
 
 router = APIRouter(
@@ -24,180 +29,294 @@ router = APIRouter(
     tags=["inventory"]
 )
 
+# Read-mostly endpoints are served cache-aside from Redis. Lists get a short
+# TTL because they include stock levels; single items can live a bit longer
+# since writes invalidate them explicitly.
+LIST_CACHE_TTL = 30
+ITEM_CACHE_TTL = 300
+
+def _category_list_key(skip, limit):
+    return f"inv:categories:{skip}:{limit}"
+
+def _category_key(category_id):
+    return f"inv:category:{category_id}"
+
+def _product_list_key(skip, limit, category_id, search):
+    return f"inv:products:{skip}:{limit}:{category_id}:{search}"
+
+def _product_key(product_id):
+    return f"inv:product:{product_id}"
+
+async def invalidate_category_cache(category_id=None):
+    await cache_delete_match("inv:categories:*")
+    if category_id is not None:
+        await cache_delete(_category_key(category_id))
+
+async def invalidate_product_cache(*product_ids):
+    await cache_delete_match("inv:products:*")
+    if product_ids:
+        await cache_delete(*[_product_key(product_id) for product_id in product_ids])
+
+# Product reads go through the products_with_stock materialized view: a
+# single-table scan of preformed rows, no join at query time. Built once at
+# import; handlers only chain per-request where/offset/limit clauses onto it.
+_PRODUCT_WITH_STOCK_STMT = select(products_with_stock)
+
+# The list endpoint projects only the columns a list view renders, keeping
+# description/specifications (potentially KB of text per row) off the wire
+_PRODUCT_LIST_STMT = select(
+    products_with_stock.c.id,
+    products_with_stock.c.name,
+    products_with_stock.c.selling_price,
+    products_with_stock.c.image_url,
+    products_with_stock.c.current_stock,
+    products_with_stock.c.status,
+)
+
+def _product_list_item(row):
+    return ProductListItem.model_construct(
+        id=row.id,
+        name=row.name,
+        selling_price=row.selling_price,
+        image_url=row.image_url,
+        current_stock=row.current_stock,
+        status=StockStatusSchema(row.status)
+    )
+
+def _product_with_stock(row):
+    # model_construct skips validation; every value here comes straight from
+    # the materialized view, so there is nothing left to validate per row
+    return ProductWithStock.model_construct(
+        id=row.id,
+        category_id=row.category_id,
+        name=row.name,
+        description=row.description,
+        model_number=row.model_number,
+        specifications=row.specifications,
+        cost_price=row.cost_price,
+        selling_price=row.selling_price,
+        barcode=row.barcode,
+        image_url=row.image_url,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        current_stock=row.current_stock,
+        status=StockStatusSchema(row.status)
+    )
+
 # Category endpoints
 @router.post("/categories", response_model=CategorySchema)
-async def create_category(category: CategoryCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_category = Category(**category.dict())
+async def create_category(category: CategoryCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    db_category = Category(**category.model_dump())
     db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
+    await db.refresh(db_category)
+    await invalidate_category_cache()
     return db_category
 
 @router.get("/categories", response_model=List[CategorySchema])
-async def read_categories(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    categories = db.query(Category).offset(skip).limit(limit).all()
+async def read_categories(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    key = _category_list_key(skip, limit)
+    cached = await cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    result = await db.execute(select(Category).offset(skip).limit(limit))
+    categories = [CategorySchema.model_validate(c).model_dump() for c in result.scalars().all()]
+
+    await cache_set(key, orjson.dumps(categories), LIST_CACHE_TTL)
     return categories
 
 @router.get("/categories/{category_id}", response_model=CategorySchema)
-async def read_category(category_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+async def read_category(category_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    key = _category_key(category_id)
+    cached = await cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    result = await db.execute(select(Category).where(Category.id == category_id))
+    db_category = result.scalar_one_or_none()
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    return db_category
+
+    category_data = CategorySchema.model_validate(db_category).model_dump()
+    await cache_set(key, orjson.dumps(category_data), ITEM_CACHE_TTL)
+    return category_data
 
 @router.put("/categories/{category_id}", response_model=CategorySchema)
-async def update_category(category_id: int, category: CategoryUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+async def update_category(category_id: int, category: CategoryUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    result = await db.execute(select(Category).where(Category.id == category_id))
+    db_category = result.scalar_one_or_none()
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    update_data = category.dict(exclude_unset=True)
+
+    update_data = category.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_category, key, value)
-    
-    db.commit()
-    db.refresh(db_category)
+
+    await db.commit()
+    await db.refresh(db_category)
+    await invalidate_category_cache(category_id)
     return db_category
 
 @router.delete("/categories/{category_id}")
-async def delete_category(category_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+async def delete_category(category_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    result = await db.execute(select(Category).where(Category.id == category_id))
+    db_category = result.scalar_one_or_none()
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    db.delete(db_category)
-    db.commit()
+
+    await db.delete(db_category)
+    await db.commit()
+    await invalidate_category_cache(category_id)
     return {"message": "Category deleted successfully"}
 
 # Product endpoints
 @router.post("/products", response_model=ProductSchema)
-async def create_product(product: ProductCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+async def create_product(product: ProductCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
     # Check if category exists
-    category = db.query(Category).filter(Category.id == product.category_id).first()
+    result = await db.execute(select(Category).where(Category.id == product.category_id))
+    category = result.scalar_one_or_none()
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    db_product = Product(**product.dict())
+
+    db_product = Product(**product.model_dump())
     db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
-    
+    await db.commit()
+    await db.refresh(db_product)
+
     # Initialize inventory with zero quantity
     inventory_item = InventoryItem(product_id=db_product.id, quantity=0, status=StockStatus.OUT_OF_STOCK)
     db.add(inventory_item)
-    db.commit()
-    
+    await db.commit()
+
+    await refresh_products_with_stock()
+    await invalidate_product_cache()
     return db_product
 
-@router.get("/products", response_model=List[ProductWithStock])
+@router.get("/products", response_model=List[ProductListItem])
 async def read_products(
-    skip: int = 0, 
-    limit: int = 100, 
+    skip: int = 0,
+    limit: int = 100,
     category_id: Optional[int] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Product, InventoryItem).join(InventoryItem, Product.id == InventoryItem.product_id, isouter=True)
-    
+    key = _product_list_key(skip, limit, category_id, search)
+    cached = await cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    stmt = _PRODUCT_LIST_STMT
+
     if category_id:
-        query = query.filter(Product.category_id == category_id)
-    
+        stmt = stmt.where(products_with_stock.c.category_id == category_id)
+
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Product.name.ilike(search_term)) | 
-            (Product.model_number.ilike(search_term)) |
-            (Product.description.ilike(search_term))
-        )
-    
-    results = query.offset(skip).limit(limit).all()
-    
-    products_with_stock = []
-    for product, inventory in results:
-        product_dict = {**ProductSchema.from_orm(product).dict()}
-        
-        # Add inventory information
-        if inventory:
-            product_dict["current_stock"] = inventory.quantity
-            product_dict["status"] = inventory.status
+        if len(search) >= 3:
+            # Full-text search against the generated tsvector; latency is
+            # independent of description length
+            stmt = stmt.where(products_with_stock.c.search_vector.op("@@")(func.plainto_tsquery("english", search)))
         else:
-            product_dict["current_stock"] = 0
-            product_dict["status"] = StockStatus.OUT_OF_STOCK
-        
-        products_with_stock.append(ProductWithStock(**product_dict))
-    
-    return products_with_stock
+            # Short partial tokens fall back to the trigram-indexed ILIKE path
+            search_term = f"%{search}%"
+            stmt = stmt.where(
+                (products_with_stock.c.name.ilike(search_term)) |
+                (products_with_stock.c.model_number.ilike(search_term)) |
+                (products_with_stock.c.description.ilike(search_term))
+            )
+
+    result = await db.execute(stmt.offset(skip).limit(limit))
+
+    products = [_product_list_item(row).model_dump() for row in result.all()]
+
+    await cache_set(key, orjson.dumps(products), LIST_CACHE_TTL)
+    return products
 
 @router.get("/products/{product_id}", response_model=ProductWithStock)
-async def read_product(product_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
-    if db_product is None:
+async def read_product(product_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    key = _product_key(product_id)
+    cached = await cache_get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    result = await db.execute(_PRODUCT_WITH_STOCK_STMT.where(products_with_stock.c.id == product_id))
+    row = result.first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    
-    # Get inventory information
-    inventory = db.query(InventoryItem).filter(InventoryItem.product_id == product_id).first()
-    
-    product_dict = {**ProductSchema.from_orm(db_product).dict()}
-    
-    # Add inventory information
-    if inventory:
-        product_dict["current_stock"] = inventory.quantity
-        product_dict["status"] = inventory.status
-    else:
-        product_dict["current_stock"] = 0
-        product_dict["status"] = StockStatus.OUT_OF_STOCK
-    
-    return ProductWithStock(**product_dict)
+
+    product_data = _product_with_stock(row).model_dump()
+    await cache_set(key, orjson.dumps(product_data), ITEM_CACHE_TTL)
+    return product_data
 
 @router.put("/products/{product_id}", response_model=ProductSchema)
-async def update_product(product_id: int, product: ProductUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+async def update_product(product_id: int, product: ProductUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    result = await db.execute(select(Product).where(Product.id == product_id))
+    db_product = result.scalar_one_or_none()
     if db_product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    
-    update_data = product.dict(exclude_unset=True)
-    
+
+    update_data = product.model_dump(exclude_unset=True)
+
     # Check if category exists if it's being updated
     if "category_id" in update_data:
-        category = db.query(Category).filter(Category.id == update_data["category_id"]).first()
+        result = await db.execute(select(Category).where(Category.id == update_data["category_id"]))
+        category = result.scalar_one_or_none()
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
-    
+
     for key, value in update_data.items():
         setattr(db_product, key, value)
-    
-    db.commit()
-    db.refresh(db_product)
+
+    await db.commit()
+    await db.refresh(db_product)
+    await refresh_products_with_stock()
+    await invalidate_product_cache(product_id)
     return db_product
 
 @router.delete("/products/{product_id}")
-async def delete_product(product_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    result = await db.execute(select(Product).where(Product.id == product_id))
+    db_product = result.scalar_one_or_none()
     if db_product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    
+
     # Delete associated inventory item first
-    db.query(InventoryItem).filter(InventoryItem.product_id == product_id).delete()
-    
-    db.delete(db_product)
-    db.commit()
+    await db.execute(delete(InventoryItem).where(InventoryItem.product_id == product_id))
+
+    await db.delete(db_product)
+    await db.commit()
+    await refresh_products_with_stock()
+    await invalidate_product_cache(product_id)
     return {"message": "Product deleted successfully"}
 
 # Inventory endpoints
 @router.put("/inventory/{product_id}", response_model=InventoryItemSchema)
 async def update_inventory(
-    product_id: int, 
-    inventory_data: InventoryItemUpdate, 
-    db: Session = Depends(get_db), 
+    product_id: int,
+    inventory_data: InventoryItemUpdate,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Check if product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
+    result = await db.execute(select(Product).where(Product.id == product_id))
+    product = result.scalar_one_or_none()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    
+
     # Check if inventory item exists, create if not
-    inventory_item = db.query(InventoryItem).filter(InventoryItem.product_id == product_id).first()
+    result = await db.execute(select(InventoryItem).where(InventoryItem.product_id == product_id))
+    inventory_item = result.scalar_one_or_none()
     if not inventory_item:
-        inventory_item = InventoryItem(product_id=product_id)
\ No newline at end of file
+        inventory_item = InventoryItem(product_id=product_id)
+        db.add(inventory_item)
+
+    update_data = inventory_data.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(inventory_item, key, value)
+
+    await db.commit()
+    await db.refresh(inventory_item)
+    await refresh_products_with_stock()
+    await invalidate_product_cache(product_id)
+    return inventory_item
@@ -1,111 +1,129 @@
+import re
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload, raiseload
 from typing import List, Optional
 from datetime import date, timedelta
 
 from ..core.db import get_db
 from ..core.security import get_current_active_user
 from ..models.user import User
-from ..models.inventory import Product, InventoryItem
+from ..models.inventory import refresh_products_with_stock
 from ..models.sales import Sale, SaleItem, PaymentMethod
 from ..schemas.sales import (
     SaleCreate,
     Sale as SaleSchema,
     SaleItem as SaleItemSchema
 )
+from .inventory import invalidate_product_cache
 
 router = APIRouter(
     prefix="/sales",
     tags=["sales"]
 )
 
+# Invariant part of the sales queries, built once at import. selectinload for
+# the one-to-many items collection, joinedload for the many-to-one product on
+# each item: two queries total, regardless of page size. raiseload("*") makes
+# any other lazy load raise instead of silently issuing a query per row.
+_SALES_STMT = select(Sale).options(
+    selectinload(Sale.items).joinedload(SaleItem.product),
+    raiseload("*")
+)
+
+# The create_sale function signals validation failures with RAISE EXCEPTION;
+# map its messages (defined in app/models/sales.py) back onto the HTTP errors
+# this endpoint has always returned.
+_PRODUCT_NOT_FOUND_RE = re.compile(r"Product with ID \d+ not found")
+_INSUFFICIENT_STOCK_RE = re.compile(r"Insufficient inventory for product \S.*")
+
 @router.post("/", response_model=SaleSchema)
 async def create_sale(
-    sale: SaleCreate, 
-    db: Session = Depends(get_db), 
+    sale: SaleCreate,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    # Create new sale
-    db_sale = Sale(
-        user_id=current_user.id,
-        customer_name=sale.customer_name,
-        customer_email=sale.customer_email,
-        customer_phone=sale.customer_phone,
-        total_amount=sale.total_amount,
-        payment_method=sale.payment_method
-    )
-    db.add(db_sale)
-    db.commit()
-    db.refresh(db_sale)
-    
-    # Add sale items and update inventory
-    for item in sale.items:
-        # Check if product exists
-        product = db.query(Product).filter(Product.id == item.product_id).first()
-        if not product:
-            db.delete(db_sale)
-            db.commit()
-            raise HTTPException(status_code=404, detail=f"Product with ID {item.product_id} not found")
-        
-        # Check if sufficient inventory
-        inventory = db.query(InventoryItem).filter(InventoryItem.product_id == item.product_id).first()
-        if not inventory or inventory.quantity < item.quantity:
-            db.delete(db_sale)
-            db.commit()
-            raise HTTPException(status_code=400, detail=f"Insufficient inventory for product {product.name}")
-        
-        # Create sale item
-        db_sale_item = SaleItem(
-            sale_id=db_sale.id,
-            product_id=item.product_id,
-            quantity=item.quantity,
-            unit_price=item.unit_price,
-            total_price=item.total_price
+    # The whole sale — validation, inserts, stock decrement — runs inside the
+    # create_sale database function, so it costs a single round trip and the
+    # inventory row locks never span a network wait. An exception inside the
+    # function rolls the whole sale back.
+    payload = orjson.dumps(sale.model_dump()).decode()
+    try:
+        result = await db.execute(
+            text("SELECT create_sale(:uid, cast(:payload AS jsonb))"),
+            {"uid": current_user.id, "payload": payload},
         )
-        db.add(db_sale_item)
-        
-        # Update inventory
-        inventory.quantity -= item.quantity
-        if inventory.quantity <= 0:
-            inventory.status = StockStatus.OUT_OF_STOCK
-        elif inventory.quantity < 5:  # Threshold for low stock
-            inventory.status = StockStatus.LOW_STOCK
-    
-    db.commit()
-    
-    # Refresh sale to include items
-    db_sale = db.query(Sale).filter(Sale.id == db_sale.id).first()
-    return db_sale
+        sale_id = result.scalar_one()
+        await db.commit()
+    except DBAPIError as exc:
+        await db.rollback()
+        message = str(exc.orig)
+        match = _PRODUCT_NOT_FOUND_RE.search(message)
+        if match:
+            raise HTTPException(status_code=404, detail=match.group(0))
+        match = _INSUFFICIENT_STOCK_RE.search(message)
+        if match:
+            raise HTTPException(status_code=400, detail=match.group(0))
+        raise
+
+    # Stock levels changed, so the view and cached product listings are stale
+    await refresh_products_with_stock()
+    await invalidate_product_cache(*[item.product_id for item in sale.items])
+
+    # Load the sale with its items (eager load; lazy loading is unavailable in async)
+    result = await db.execute(_SALES_STMT.where(Sale.id == sale_id))
+    return result.scalar_one()
 
 @router.get("/", response_model=List[SaleSchema])
 async def get_sales(
-    skip: int = 0, 
-    limit: int = 100, 
+    skip: int = 0,
+    limit: int = 100,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db), 
+    stream: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Sale)
-    
+    stmt = _SALES_STMT
+
     # Filter by date range if provided
     if start_date:
-        query = query.filter(Sale.created_at >= start_date)
+        stmt = stmt.where(Sale.created_at >= start_date)
     if end_date:
         # Add one day to include the end date
         next_day = end_date + timedelta(days=1)
-        query = query.filter(Sale.created_at < next_day)
-    
-    sales = query.order_by(Sale.created_at.desc()).offset(skip).limit(limit).all()
+        stmt = stmt.where(Sale.created_at < next_day)
+
+    stmt = stmt.order_by(Sale.created_at.desc()).offset(skip).limit(limit)
+
+    if stream:
+        # Server-side cursor + NDJSON for report/export pages: memory use is
+        # constant and the first row goes out before the query finishes
+        result = await db.stream(stmt.execution_options(yield_per=100))
+
+        async def iter_sales():
+            async for sale in result.scalars():
+                yield orjson.dumps(SaleSchema.model_validate(sale).model_dump()) + b"\n"
+
+        return StreamingResponse(iter_sales(), media_type="application/x-ndjson")
+
+    result = await db.execute(stmt)
+    sales = result.scalars().all()
     return sales
 
 @router.get("/{sale_id}", response_model=SaleSchema)
 async def get_sale(
     sale_id: int,
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    sale = db.query(Sale).filter(Sale.id == sale_id).first()
+    result = await db.execute(_SALES_STMT.where(Sale.id == sale_id))
+    sale = result.scalar_one_or_none()
     if not sale:
         raise HTTPException(status_code=404, detail="Sale not found")
-    return sale
\ No newline at end of file
+    return sale
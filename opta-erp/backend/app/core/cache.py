@@ -0,0 +1,38 @@
+# app/core/cache.py
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+import os
+
+# Get Redis URL from environment variable
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Shared async client with its own connection pool, so cache lookups never
+# block the event loop
+redis = aioredis.from_url(REDIS_URL)
+
+# The cache is best-effort: if Redis is down, callers fall back to the DB
+async def cache_get(key: str):
+    try:
+        return await redis.get(key)
+    except RedisError:
+        return None
+
+async def cache_set(key: str, value: bytes, ttl: int):
+    try:
+        await redis.setex(key, ttl, value)
+    except RedisError:
+        pass
+
+async def cache_delete(*keys: str):
+    try:
+        await redis.delete(*keys)
+    except RedisError:
+        pass
+
+async def cache_delete_match(pattern: str):
+    try:
+        keys = [key async for key in redis.scan_iter(match=pattern)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError:
+        pass
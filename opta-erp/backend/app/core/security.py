@@ -2,34 +2,137 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, VerificationError, InvalidHashError
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..schemas.user import TokenData, UserRole
 from ..models.user import User
 from ..core.db import get_db
+from ..core.cache import cache_get, cache_set, cache_delete
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import msgpack
 import os
+import secrets
 
 # Get secrets from environment variables
 SECRET_KEY = os.getenv("SECRET_KEY", "09d25e094faa6ca2556c818166b7a9563b93f7099f6f0f4caa6cf63b88e8d3e7")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Argon2id at the OWASP-recommended profile (19 MiB, t=2, p=1). Raise
+# memory_cost toward 47104 if the production latency budget allows.
+ph = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Only used to verify bcrypt hashes created before the Argon2 switch
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+# Verified on the user-not-found path so a login attempt against a missing
+# account costs the same as one with a wrong password; otherwise the early
+# return leaks which emails exist via response timing
+DUMMY_HASH = ph.hash("dummy")
+
+# auto_error off so requests authenticating with the session cookie alone
+# are not rejected for lacking an Authorization header
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
+
+SESSION_COOKIE = "session_id"
+
+# Dedicated pool so 50-200ms hashes neither block the event loop nor starve
+# the default threadpool. argon2-cffi releases the GIL while hashing, so
+# threads use all cores without process-pool pickling overhead.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+def _user_cache_key(email: str):
+    return f"auth:user:{email}"
+
+def _pack_user(user: User):
+    return msgpack.packb({
+        "id": user.id,
+        "email": user.email,
+        "full_name": user.full_name,
+        "role": UserRole(user.role).value,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    })
+
+def _unpack_user(raw: bytes):
+    data = msgpack.unpackb(raw)
+    return User(
+        id=data["id"],
+        email=data["email"],
+        full_name=data["full_name"],
+        role=UserRole(data["role"]),
+        is_active=data["is_active"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
+
+async def invalidate_user_cache(*emails: str):
+    await cache_delete(*[_user_cache_key(email) for email in emails])
+
+def _session_key(session_id: str):
+    return f"sess:{session_id}"
+
+async def create_session(user: User):
+    """Store a session-id -> email mapping in Redis and return the session id.
+
+    The session deliberately holds only the email, not the user record: the
+    record is always resolved through the auth:user: cache, which update_user
+    invalidates, so role and is_active changes apply to live sessions too.
+    The TTL matches the token lifetime.
+    """
+    session_id = secrets.token_urlsafe(32)
+    await cache_set(_session_key(session_id), user.email.encode(), ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    return session_id
+
+async def _resolve_user(db: AsyncSession, email: str):
+    """User record for an authenticated email: Redis cache first, then DB.
+
+    On a cache hit no DB connection is checked out for auth at all. The TTL
+    matches the token lifetime; invalidate_user_cache drops the entry when
+    the record changes.
+    """
+    cached = await cache_get(_user_cache_key(email))
+    if cached is not None:
+        return _unpack_user(cached)
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+    await cache_set(_user_cache_key(user.email), _pack_user(user), ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    return user
 
 def verify_password(plain_password, hashed_password):
+    if hashed_password.startswith("$argon2"):
+        try:
+            return ph.verify(hashed_password, plain_password)
+        except (VerifyMismatchError, VerificationError, InvalidHashError):
+            return False
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return ph.hash(password)
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        return False
-    if not verify_password(password, user.hashed_password):
+async def verify_password_async(plain_password, hashed_password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(HASH_POOL, verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(HASH_POOL, get_password_hash, password)
+
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+    # Always verify against some hash so both failure modes take the same time
+    hashed_password = user.hashed_password if user else DUMMY_HASH
+    if not await verify_password_async(password, hashed_password) or not user:
         return False
     return user
 
@@ -43,12 +146,29 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    token: Optional[str] = Depends(oauth2_scheme),
+):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    # Session cookie first: Redis resolves the session and usually the user
+    # record too, with no signature verification. The bearer JWT below stays
+    # as the fallback for cross-service calls, expired sessions, and Redis
+    # outages.
+    session_id = request.cookies.get(SESSION_COOKIE)
+    if session_id:
+        raw = await cache_get(_session_key(session_id))
+        if raw is not None:
+            user = await _resolve_user(db, raw.decode())
+            if user is not None:
+                return user
+    if token is None:
+        raise credentials_exception
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
@@ -57,7 +177,7 @@ async def get_current_user(db: Session = Depends(get_db), token: str = Depends(o
         token_data = TokenData(email=email)
     except JWTError:
         raise credentials_exception
-    user = db.query(User).filter(User.email == token_data.email).first()
+    user = await _resolve_user(db, token_data.email)
     if user is None:
         raise credentials_exception
     return user
@@ -73,4 +193,4 @@ def get_superadmin_user(current_user: User = Depends(get_current_active_user)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user
\ No newline at end of file
+    return current_user
@@ -1,9 +1,15 @@
 # app/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 import os
 from dotenv import load_dotenv
 
+from .core.db import Base, engine
+from .models.inventory import PG_TRGM_DDL, SCHEMA_UPGRADE_DDL, PRODUCTS_WITH_STOCK_DDL
+from .models.sales import CREATE_SALE_FUNCTION_DDL
+
 # Import API routers
 from .api import auth, inventory, sales
 
@@ -14,7 +20,8 @@ load_dotenv()
 app = FastAPI(
     title="Computer Hardware ERP API",
     description="API for managing computer hardware inventory and sales",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -31,6 +38,22 @@ app.include_router(auth.router)
 app.include_router(inventory.router)
 app.include_router(sales.router)
 
+@app.on_event("startup")
+async def init_db_schema():
+    # All idempotent, so safe on every boot: the pg_trgm extension first
+    # (create_all's trigram index needs it), then the tables, then the
+    # upgrade statements for databases that predate the declared schema, then
+    # the products_with_stock materialized view and the create_sale function
+    # (CREATE OR REPLACE keeps the latter current with the code).
+    async with engine.begin() as conn:
+        await conn.execute(text(PG_TRGM_DDL))
+        await conn.run_sync(Base.metadata.create_all)
+        for ddl in SCHEMA_UPGRADE_DDL:
+            await conn.execute(text(ddl))
+        for ddl in PRODUCTS_WITH_STOCK_DDL:
+            await conn.execute(text(ddl))
+        await conn.execute(text(CREATE_SALE_FUNCTION_DDL))
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to Computer Hardware ERP API"}
@@ -0,0 +1,167 @@
+# app/models/inventory.py
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, Enum, DateTime, Index, Computed, MetaData, Table, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from sqlalchemy.sql.sqltypes import TIMESTAMP
+import enum
+from ..core.db import Base, engine
+
+class StockStatus(str, enum.Enum):
+    IN_STOCK = "in_stock"
+    LOW_STOCK = "low_stock"
+    OUT_OF_STOCK = "out_of_stock"
+
+# Threshold for low stock
+LOW_STOCK_THRESHOLD = 5
+
+# Shared between the generated-column declaration below and the upgrade DDL
+# so the two can never drift apart
+_SEARCH_VECTOR_SQL = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(model_number, '') || ' ' || coalesce(description, ''))"
+
+class Category(Base):
+    __tablename__ = "categories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    description = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), nullable=True, onupdate=func.now())
+
+    # Relationships
+    products = relationship("Product", back_populates="category")
+
+class Product(Base):
+    __tablename__ = "products"
+    __table_args__ = (
+        # Backs the ILIKE '%term%' search in read_products; requires the
+        # pg_trgm extension (CREATE EXTENSION IF NOT EXISTS pg_trgm)
+        Index(
+            "ix_products_name_trgm",
+            "name", "model_number", "description",
+            postgresql_using="gin",
+            postgresql_ops={
+                "name": "gin_trgm_ops",
+                "model_number": "gin_trgm_ops",
+                "description": "gin_trgm_ops",
+            },
+        ),
+        # Backs the full-text search path in read_products
+        Index("ix_products_fts", "search_vector", postgresql_using="gin"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    model_number = Column(String, nullable=True)
+    specifications = Column(Text, nullable=True)
+    cost_price = Column(Float, nullable=False)
+    selling_price = Column(Float, nullable=False)
+    barcode = Column(String, unique=True, nullable=True)
+    image_url = Column(String, nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), nullable=True, onupdate=func.now())
+    # Generated in the database so the search document never drifts from the
+    # source columns
+    search_vector = Column(TSVECTOR, Computed(_SEARCH_VECTOR_SQL, persisted=True))
+
+    # Relationships
+    category = relationship("Category", back_populates="products")
+    inventory = relationship("InventoryItem", back_populates="product")
+
+class InventoryItem(Base):
+    __tablename__ = "inventory"
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    quantity = Column(Integer, default=0, nullable=False)
+    location = Column(String, nullable=True)
+    # values_callable so the database enum labels are the lowercase values
+    # ('in_stock', ...) rather than the member names, matching the raw SQL
+    # in the materialized view and the create_sale function
+    status = Column(
+        Enum(StockStatus, values_callable=lambda e: [m.value for m in e]),
+        default=StockStatus.IN_STOCK,
+        nullable=False
+    )
+    last_updated = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    product = relationship("Product", back_populates="inventory")
+
+# There is no alembic environment in this tree: the schema comes from
+# Base.metadata.create_all at startup, which only creates tables that are
+# missing entirely. These idempotent statements bring databases created
+# before the search/index work up to the declared schema. The extension must
+# exist before create_all, since the trigram index declared above needs
+# gin_trgm_ops.
+PG_TRGM_DDL = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+SCHEMA_UPGRADE_DDL = (
+    f"ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({_SEARCH_VECTOR_SQL}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_products_name_trgm ON products USING gin (name gin_trgm_ops, model_number gin_trgm_ops, description gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_products_fts ON products USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_products_category_id ON products (category_id)",
+    "CREATE INDEX IF NOT EXISTS ix_inventory_product_id ON inventory (product_id)",
+    "CREATE INDEX IF NOT EXISTS ix_sales_created_at ON sales (created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_sale_items_sale_id ON sale_items (sale_id)",
+    "CREATE INDEX IF NOT EXISTS ix_sale_items_product_id ON sale_items (product_id)",
+)
+
+# Materialized view pre-joining products and inventory for the product list
+# hot path: read_products becomes a single-table scan of preformed rows.
+# Kept in its own MetaData so Base.metadata.create_all never tries to create
+# it as a regular table.
+products_with_stock = Table(
+    "products_with_stock",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("category_id", Integer),
+    Column("name", String),
+    Column("description", Text),
+    Column("model_number", String),
+    Column("specifications", Text),
+    Column("cost_price", Float),
+    Column("selling_price", Float),
+    Column("barcode", String),
+    Column("image_url", String),
+    Column("created_at", TIMESTAMP(timezone=True)),
+    Column("updated_at", TIMESTAMP(timezone=True)),
+    Column("search_vector", TSVECTOR),
+    Column("current_stock", Integer),
+    Column("status", String),
+)
+
+# Idempotent DDL, run at application startup. The unique index on id is what
+# allows REFRESH ... CONCURRENTLY.
+PRODUCTS_WITH_STOCK_DDL = (
+    f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS products_with_stock AS
+    SELECT p.id, p.category_id, p.name, p.description, p.model_number,
+           p.specifications, p.cost_price, p.selling_price, p.barcode,
+           p.image_url, p.created_at, p.updated_at, p.search_vector,
+           coalesce(i.quantity, 0) AS current_stock,
+           CASE WHEN coalesce(i.quantity, 0) <= 0 THEN 'out_of_stock'
+                WHEN coalesce(i.quantity, 0) < {LOW_STOCK_THRESHOLD} THEN 'low_stock'
+                ELSE 'in_stock' END AS status
+    FROM products p
+    LEFT JOIN inventory i ON i.product_id = p.id
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_products_with_stock_id ON products_with_stock (id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_with_stock_category_id ON products_with_stock (category_id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_with_stock_fts ON products_with_stock USING gin (search_vector)",
+)
+
+async def refresh_products_with_stock():
+    """Bring the view in step after a write that touches products or stock.
+
+    REFRESH ... CONCURRENTLY refuses to run inside a transaction block and
+    AsyncSession always begins one, so this uses its own autocommit
+    connection. CONCURRENTLY keeps readers unblocked at the cost of a slower
+    refresh; if sale volume ever makes the per-write refresh noticeable,
+    debounce it behind LISTEN/NOTIFY instead.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY products_with_stock"))
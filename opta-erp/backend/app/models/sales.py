@@ -0,0 +1,136 @@
+# app/models/sales.py
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, Enum, DateTime
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from sqlalchemy.sql.sqltypes import TIMESTAMP
+import enum
+from ..core.db import Base
+from .inventory import LOW_STOCK_THRESHOLD
+
+class PaymentMethod(str, enum.Enum):
+    CASH = "cash"
+    CREDIT_CARD = "credit_card"
+    DEBIT_CARD = "debit_card"
+    BANK_TRANSFER = "bank_transfer"
+    MOBILE_PAYMENT = "mobile_payment"
+
+class Sale(Base):
+    __tablename__ = "sales"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    customer_name = Column(String, nullable=True)
+    customer_email = Column(String, nullable=True)
+    customer_phone = Column(String, nullable=True)
+    total_amount = Column(Float, nullable=False)
+    # Persist the lowercase values, not the member names; raw SQL relies on it
+    payment_method = Column(
+        Enum(PaymentMethod, values_callable=lambda e: [m.value for m in e]),
+        default=PaymentMethod.CASH,
+        nullable=False
+    )
+    # Indexed: get_sales filters and orders on created_at
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), index=True)
+
+    # Relationships
+    user = relationship("User")
+    items = relationship("SaleItem", back_populates="sale")
+
+class SaleItem(Base):
+    __tablename__ = "sale_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sale_id = Column(Integer, ForeignKey("sales.id"), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    quantity = Column(Integer, nullable=False)
+    unit_price = Column(Float, nullable=False)
+    total_price = Column(Float, nullable=False)
+
+    # Relationships
+    sale = relationship("Sale", back_populates="items")
+    product = relationship("Product")
+
+# The whole sale flow — validate, insert sale, insert items, update stock —
+# runs inside Postgres so a sale costs one round-trip regardless of item
+# count, and row locks are held only for the duration of the function.
+# Installed idempotently at application startup. The handler parses the
+# RAISE messages below, so keep their wording in sync with app/api/sales.py.
+CREATE_SALE_FUNCTION_DDL = f"""
+CREATE OR REPLACE FUNCTION create_sale(p_user_id integer, p_payload jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_sale_id integer;
+    v_product_id integer;
+    v_product_name text;
+BEGIN
+    INSERT INTO sales (user_id, customer_name, customer_email, customer_phone, total_amount, payment_method)
+    VALUES (
+        p_user_id,
+        p_payload->>'customer_name',
+        p_payload->>'customer_email',
+        p_payload->>'customer_phone',
+        (p_payload->>'total_amount')::double precision,
+        (p_payload->>'payment_method')::paymentmethod
+    )
+    RETURNING id INTO v_sale_id;
+
+    -- Lock the inventory rows for the whole sale up front, in a fixed order
+    -- so two concurrent multi-item sales cannot deadlock on each other
+    PERFORM 1 FROM inventory
+    WHERE product_id IN (SELECT DISTINCT (e->>'product_id')::integer
+                         FROM jsonb_array_elements(p_payload->'items') e)
+    ORDER BY product_id
+    FOR UPDATE;
+
+    -- Validate all items set-wise before writing anything: first missing
+    -- product, then first product without enough stock (quantities summed
+    -- per product, in case one appears in several items)
+    SELECT q.product_id INTO v_product_id
+    FROM (SELECT DISTINCT (e->>'product_id')::integer AS product_id
+          FROM jsonb_array_elements(p_payload->'items') e) q
+    LEFT JOIN products p ON p.id = q.product_id
+    WHERE p.id IS NULL
+    LIMIT 1;
+    IF FOUND THEN
+        RAISE EXCEPTION 'Product with ID % not found', v_product_id;
+    END IF;
+
+    SELECT p.name INTO v_product_name
+    FROM (SELECT (e->>'product_id')::integer AS product_id,
+                 sum((e->>'quantity')::integer) AS quantity
+          FROM jsonb_array_elements(p_payload->'items') e
+          GROUP BY 1) q
+    JOIN products p ON p.id = q.product_id
+    LEFT JOIN inventory i ON i.product_id = q.product_id
+    WHERE i.id IS NULL OR i.quantity < q.quantity
+    LIMIT 1;
+    IF FOUND THEN
+        RAISE EXCEPTION 'Insufficient inventory for product %', v_product_name;
+    END IF;
+
+    -- Decrement all inventory rows and recompute status in one UPDATE
+    UPDATE inventory i
+    SET quantity = i.quantity - q.quantity,
+        status = (CASE WHEN i.quantity - q.quantity <= 0 THEN 'out_of_stock'
+                       WHEN i.quantity - q.quantity < {LOW_STOCK_THRESHOLD} THEN 'low_stock'
+                       ELSE 'in_stock' END)::stockstatus
+    FROM (SELECT (e->>'product_id')::integer AS product_id,
+                 sum((e->>'quantity')::integer) AS quantity
+          FROM jsonb_array_elements(p_payload->'items') e
+          GROUP BY 1) q
+    WHERE i.product_id = q.product_id;
+
+    INSERT INTO sale_items (sale_id, product_id, quantity, unit_price, total_price)
+    SELECT v_sale_id,
+           (e->>'product_id')::integer,
+           (e->>'quantity')::integer,
+           (e->>'unit_price')::double precision,
+           (e->>'total_price')::double precision
+    FROM jsonb_array_elements(p_payload->'items') e;
+
+    RETURN v_sale_id;
+END;
+$$
+"""
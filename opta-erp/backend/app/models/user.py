@@ -17,110 +17,12 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     full_name = Column(String, nullable=True)
-    role = Column(Enum(UserRole), default=UserRole.STAFF, nullable=False)
+    # Persist the lowercase values, not the member names
+    role = Column(
+        Enum(UserRole, values_callable=lambda e: [m.value for m in e]),
+        default=UserRole.STAFF,
+        nullable=False
+    )
     is_active = Column(Boolean, default=True)
     created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), nullable=True, onupdate=func.now())
-
-# app/models/inventory.py
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, Enum, DateTime
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from sqlalchemy.sql.sqltypes import TIMESTAMP
-import enum
-from ..core.db import Base
-
-class StockStatus(str, enum.Enum):
-    IN_STOCK = "in_stock"
-    LOW_STOCK = "low_stock"
-    OUT_OF_STOCK = "out_of_stock"
-
-class Category(Base):
-    __tablename__ = "categories"
-
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, nullable=False)
-    description = Column(Text, nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    updated_at = Column(TIMESTAMP(timezone=True), nullable=True, onupdate=func.now())
-    
-    # Relationships
-    products = relationship("Product", back_populates="category")
-
-class Product(Base):
-    __tablename__ = "products"
-
-    id = Column(Integer, primary_key=True, index=True)
-    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
-    name = Column(String, nullable=False)
-    description = Column(Text, nullable=True)
-    model_number = Column(String, nullable=True)
-    specifications = Column(Text, nullable=True)
-    cost_price = Column(Float, nullable=False)
-    selling_price = Column(Float, nullable=False)
-    barcode = Column(String, unique=True, nullable=True)
-    image_url = Column(String, nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    updated_at = Column(TIMESTAMP(timezone=True), nullable=True, onupdate=func.now())
-    
-    # Relationships
-    category = relationship("Category", back_populates="products")
-    inventory = relationship("InventoryItem", back_populates="product")
-
-class InventoryItem(Base):
-    __tablename__ = "inventory"
-
-    id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
-    quantity = Column(Integer, default=0, nullable=False)
-    location = Column(String, nullable=True)
-    status = Column(Enum(StockStatus), default=StockStatus.IN_STOCK, nullable=False)
-    last_updated = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
-    
-    # Relationships
-    product = relationship("Product", back_populates="inventory")
-
-# app/models/sales.py
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, Enum, DateTime
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from sqlalchemy.sql.sqltypes import TIMESTAMP
-import enum
-from ..core.db import Base
-
-class PaymentMethod(str, enum.Enum):
-    CASH = "cash"
-    CREDIT_CARD = "credit_card"
-    DEBIT_CARD = "debit_card"
-    BANK_TRANSFER = "bank_transfer"
-    MOBILE_PAYMENT = "mobile_payment"
-
-class Sale(Base):
-    __tablename__ = "sales"
-
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    customer_name = Column(String, nullable=True)
-    customer_email = Column(String, nullable=True)
-    customer_phone = Column(String, nullable=True)
-    total_amount = Column(Float, nullable=False)
-    payment_method = Column(Enum(PaymentMethod), default=PaymentMethod.CASH, nullable=False)
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    
-    # Relationships
-    user = relationship("User")
-    items = relationship("SaleItem", back_populates="sale")
-
-class SaleItem(Base):
-    __tablename__ = "sale_items"
-
-    id = Column(Integer, primary_key=True, index=True)
-    sale_id = Column(Integer, ForeignKey("sales.id"), nullable=False)
-    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
-    quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)
-    total_price = Column(Float, nullable=False)
-    
-    # Relationships
-    sale = relationship("Sale", back_populates="items")
-    product = relationship("Product")
\ No newline at end of file
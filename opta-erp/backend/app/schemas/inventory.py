@@ -0,0 +1,109 @@
+# app/schemas/inventory.py
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, List
+from enum import Enum
+from datetime import datetime
+
+class StockStatus(str, Enum):
+    IN_STOCK = "in_stock"
+    LOW_STOCK = "low_stock"
+    OUT_OF_STOCK = "out_of_stock"
+
+# Category schemas
+class CategoryBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+class CategoryCreate(CategoryBase):
+    pass
+
+class CategoryUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+class CategoryInDB(CategoryBase):
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class Category(CategoryInDB):
+    pass
+
+# Product schemas
+class ProductBase(BaseModel):
+    category_id: int
+    name: str
+    description: Optional[str] = None
+    model_number: Optional[str] = None
+    specifications: Optional[str] = None
+    cost_price: float = Field(..., gt=0)
+    selling_price: float = Field(..., gt=0)
+    barcode: Optional[str] = None
+    image_url: Optional[str] = None
+
+class ProductCreate(ProductBase):
+    pass
+
+class ProductUpdate(BaseModel):
+    category_id: Optional[int] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    model_number: Optional[str] = None
+    specifications: Optional[str] = None
+    cost_price: Optional[float] = Field(None, gt=0)
+    selling_price: Optional[float] = Field(None, gt=0)
+    barcode: Optional[str] = None
+    image_url: Optional[str] = None
+
+class ProductInDB(ProductBase):
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class Product(ProductInDB):
+    pass
+
+class ProductWithStock(Product):
+    current_stock: int
+    status: StockStatus
+
+class ProductListItem(BaseModel):
+    """Slim row for product listings: just what a list view renders, leaving
+    out the large text columns (description, specifications)."""
+    id: int
+    name: str
+    selling_price: float
+    image_url: Optional[str] = None
+    current_stock: int
+    status: StockStatus
+
+# Inventory schemas
+class InventoryItemBase(BaseModel):
+    product_id: int
+    quantity: int = 0
+    location: Optional[str] = None
+    status: StockStatus = StockStatus.IN_STOCK
+
+class InventoryItemCreate(InventoryItemBase):
+    pass
+
+class InventoryItemUpdate(BaseModel):
+    quantity: Optional[int] = None
+    location: Optional[str] = None
+    status: Optional[StockStatus] = None
+
+class InventoryItemInDB(InventoryItemBase):
+    id: int
+    last_updated: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class InventoryItem(InventoryItemInDB):
+    pass
+
+class InventoryItemWithProduct(InventoryItem):
+    product: Product
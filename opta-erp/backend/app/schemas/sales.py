@@ -0,0 +1,52 @@
+# app/schemas/sales.py
+from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from typing import Optional, List
+from enum import Enum
+from datetime import datetime
+
+class PaymentMethod(str, Enum):
+    CASH = "cash"
+    CREDIT_CARD = "credit_card"
+    DEBIT_CARD = "debit_card"
+    BANK_TRANSFER = "bank_transfer"
+    MOBILE_PAYMENT = "mobile_payment"
+
+# Sale Item schemas
+class SaleItemBase(BaseModel):
+    product_id: int
+    quantity: int = Field(..., gt=0)
+    unit_price: float = Field(..., gt=0)
+    total_price: float = Field(..., gt=0)
+
+class SaleItemCreate(SaleItemBase):
+    pass
+
+class SaleItemInDB(SaleItemBase):
+    id: int
+    sale_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SaleItem(SaleItemInDB):
+    pass
+
+# Sale schemas
+class SaleBase(BaseModel):
+    customer_name: Optional[str] = None
+    customer_email: Optional[EmailStr] = None
+    customer_phone: Optional[str] = None
+    total_amount: float = Field(..., gt=0)
+    payment_method: PaymentMethod = PaymentMethod.CASH
+
+class SaleCreate(SaleBase):
+    items: List[SaleItemCreate]
+
+class SaleInDB(SaleBase):
+    id: int
+    user_id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class Sale(SaleInDB):
+    items: List[SaleItem]
@@ -0,0 +1,62 @@
+# tests/test_raiseload_guard.py
+#
+# Guards the raiseload("*") option on the sales list statement: the eagerly
+# loaded relationships must come back populated, and any accidental lazy load
+# must raise instead of silently issuing a query per row.
+#
+# Runs against in-memory SQLite so it needs no live Postgres. The products
+# table is created with raw DDL because the declarative model carries a
+# Postgres-only generated tsvector column.
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.core.db import Base
+from app.models.sales import Sale, SaleItem, PaymentMethod
+from app.api.sales import _SALES_STMT
+
+PRODUCTS_DDL = """
+CREATE TABLE products (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER,
+    name VARCHAR,
+    description TEXT,
+    model_number VARCHAR,
+    specifications TEXT,
+    cost_price FLOAT,
+    selling_price FLOAT,
+    barcode VARCHAR,
+    image_url VARCHAR,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    search_vector TEXT
+)
+"""
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(PRODUCTS_DDL))
+    Base.metadata.create_all(engine, tables=[Sale.__table__, SaleItem.__table__])
+    with Session(engine) as db:
+        db.execute(text(
+            "INSERT INTO products (id, category_id, name, cost_price, selling_price) "
+            "VALUES (1, 1, 'GPU', 100.0, 150.0)"
+        ))
+        sale = Sale(user_id=1, total_amount=150.0, payment_method=PaymentMethod.CASH)
+        db.add(sale)
+        db.flush()
+        db.add(SaleItem(sale_id=sale.id, product_id=1, quantity=1, unit_price=150.0, total_price=150.0))
+        db.commit()
+        yield db
+
+def test_sales_statement_eager_loads_items_and_products(session):
+    sale = session.execute(_SALES_STMT).scalars().one()
+    assert sale.items[0].product.name == "GPU"
+
+def test_sales_statement_blocks_accidental_lazy_loads(session):
+    sale = session.execute(_SALES_STMT).scalars().one()
+    with pytest.raises(InvalidRequestError):
+        sale.user